@@ -45,8 +45,8 @@ class FromBinance(ImportDataCryptoCurrencies):
     fiat : str
         A fiat currency or a crypto-currency. Binance don't allow fiat
         currencies, but USD theter.
-    form : {'xlsx', 'csv'}
-        Your favorit format. Only 'xlsx' and 'csv' for the moment.
+    form : {'xlsx', 'csv', 'parquet', 'feather'}
+        Your favorit format. Parquet and feather formats need pyarrow.
 
     See Also
     --------
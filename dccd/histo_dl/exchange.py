@@ -29,6 +29,13 @@ from dccd.tools.date_time import str_to_span, span_to_str
 
 __all__ = ['ImportDataCryptoCurrencies']
 
+# Functions to read saved files, with respect to their extension
+_READERS = {
+    'xlsx': pd.read_excel,
+    'parquet': pd.read_parquet,
+    'feather': pd.read_feather,
+}
+
 
 class ImportDataCryptoCurrencies:
     """ Base class to import data about crypto-currencies from some exchanges.
@@ -47,8 +54,8 @@ class ImportDataCryptoCurrencies:
         The platform of your choice: 'Kraken', 'Poloniex'.
     fiat : str
         A fiat currency or a crypto-currency.
-    form : {'xlsx', 'csv'}
-        Your favorit format. Only 'xlsx' and 'csv' at the moment.
+    form : {'xlsx', 'csv', 'parquet', 'feather'}
+        Your favorit format. Parquet and feather formats need pyarrow.
 
     Notes
     -----
@@ -104,10 +111,9 @@ class ImportDataCryptoCurrencies:
 
         else:
             last_file = sorted(os.listdir(self.full_path), reverse=True)[0]
-            if last_file.split('.')[-1] == 'xlsx':
-                self.last_df = pd.read_excel(
-                    self.full_path + '/' + str(last_file)
-                )
+            reader = _READERS.get(last_file.split('.')[-1])
+            if reader is not None:
+                self.last_df = reader(self.full_path + '/' + str(last_file))
 
                 return self.last_df.TS.iloc[-1]
 
@@ -163,8 +169,8 @@ class ImportDataCryptoCurrencies:
 
         Parameters
         ----------
-        form : {'xlsx', 'csv'}
-            Format to save data.
+        form : {'xlsx', 'csv', 'parquet', 'feather'}
+            Format to save data, 'parquet' and 'feather' need pyarrow.
         by_period : {'Y', 'M', 'D'}
             - If 'Y' group data by year.
             - If 'M' group data by month.
@@ -190,10 +196,22 @@ class ImportDataCryptoCurrencies:
                 group.to_csv(
                     self.full_path + '/' + self._name_file(name) + '.' + form
                 )
+            elif form in ['parquet', 'feather']:
+                self._columnar_format(name, form, group)
             else:
                 print('Not allowing fomat')
         return self
 
+    def _columnar_format(self, name, form, group):
+        """ Save as parquet or feather format (need pyarrow). """
+        path = self.full_path + '/' + self._name_file(name) + '.' + form
+        df_group = group.reset_index(drop=True)
+        if form == 'parquet':
+            df_group.to_parquet(path)
+        else:
+            df_group.to_feather(path)
+        return self
+
     def _excel_format(self, name, form, group):
         """ Save as excel format. """
         writer = pd.ExcelWriter(
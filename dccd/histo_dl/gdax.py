@@ -44,8 +44,8 @@ class FromGDax(ImportDataCryptoCurrencies):
             is 60 seconds.
     fiat : str
         A fiat currency or a crypto-currency.
-    form : {'xlsx', 'csv'}
-        Your favorit format. Only 'xlsx' and 'csv' for the moment.
+    form : {'xlsx', 'csv', 'parquet', 'feather'}
+        Your favorit format. Parquet and feather formats need pyarrow.
 
     See Also
     --------
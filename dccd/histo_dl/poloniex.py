@@ -17,16 +17,33 @@
 """
 
 # Import built-in packages
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import time
 
 # Import third-party packages
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import local packages
 from dccd.histo_dl.exchange import ImportDataCryptoCurrencies
 
 __all__ = ['FromPoloniex']
 
+# Maximal number of observations downloaded by request
+_WINDOW_SIZE = 5000
+# Number of requests sent simultaneously
+_N_WORKERS = 4
+# Minimal time (in seconds) between two requests, Poloniex allows 6 calls/s
+_MIN_INTERVAL = 0.25
+# Periods (in seconds) allowed by Poloniex
+_VALID_SPANS = frozenset([300, 900, 1800, 7200, 14400, 86400])
+
 
 class FromPoloniex(ImportDataCryptoCurrencies):
     """ Class to import crypto-currencies data from the Poloniex exchange.
@@ -37,15 +54,16 @@ class FromPoloniex(ImportDataCryptoCurrencies):
         The path where data will be save.
     crypto : str
         The abreviation of the crypto-currency.
-    span : {int, 'weekly', 'daily', 'hourly'}
+    span : {int, 'daily', 'four-hourly', 'bi-hourly', 'half-hourly',\
+            'quarter-hourly', '5-minute'}
         - If str, periodicity of observation.
-        - If int, number of the seconds between each observation, minimal span\
-            is 300 seconds.
+        - If int, number of the seconds between each observation, allowed\
+            spans are 300, 900, 1800, 7200, 14400 and 86400 seconds.
     fiat : str
         A fiat currency or a crypto-currency. Poloniex don't allow fiat
         currencies, but USD theter.
-    form : {'xlsx', 'csv'}
-        Your favorit format. Only 'xlsx' and 'csv' for the moment.
+    form : {'xlsx', 'csv', 'parquet', 'feather'}
+        Your favorit format. Parquet and feather formats need pyarrow.
 
     See Also
     --------
@@ -94,25 +112,176 @@ class FromPoloniex(ImportDataCryptoCurrencies):
             self, path, crypto, span, 'Poloniex', fiat, form
         )
 
+        if self.span not in _VALID_SPANS:
+            raise ValueError('span must be one of {} seconds'.format(
+                sorted(_VALID_SPANS)
+            ))
+
         self.pair = self.fiat + '_' + crypto
-        self.full_path = self.path + '/Poloniex/Data/Clean_Data/'
-        self.full_path += str(self.per) + '/'
-        self.full_path += str(self.crypto) + str(self.fiat)
+        self.full_path = os.path.join(
+            self.path, 'Poloniex', 'Data', 'Clean_Data', str(self.per),
+            str(self.crypto) + str(self.fiat)
+        )
 
-    def _import_data(self, start='last', end='now'):
-        self.start, self.end = self._set_time(start, end)
+        # Length of a window of observations in seconds
+        self._step = _WINDOW_SIZE * self.span
+
+        # Closed windows are immutable, they are cached on disk
+        self._cache_dir = os.path.join(self.path, 'Poloniex', '.cache')
+        # Last open window as (start, end, etag, data), it is revalidated
+        # with its etag when it is requested again
+        self._open_window = None
 
-        param = {
+        # Parameters invariant between requests
+        self._url = 'https://poloniex.com/public'
+        self._param = {
             'command': 'returnChartData',
             'currencyPair': self.pair,
-            'start': self.start,
-            'end': self.end,
             'period': self.span
         }
 
-        r = requests.get('https://poloniex.com/public', param)
+        # Throttle shared by the workers, start time of the next request
+        self._lock = threading.Lock()
+        self._next_request = 0.
+
+        # Keep-alive session, reuse the same connection between requests
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=_N_WORKERS,
+            # Retry mainly rate limit and server errors, an unreachable
+            # host fails fast
+            max_retries=Retry(
+                total=8,
+                connect=2,
+                read=2,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
+
+    def _import_data(self, start='last', end='now'):
+        self.start, self.end = self._set_time(start, end)
+
+        if (self.end - self.start) // self.span < _WINDOW_SIZE:
+
+            return self._fetch_window(self.start, self.end)
+
+        return self._import_data_huge()
+
+    def _import_data_huge(self):
+        """ Download data by windows of `_WINDOW_SIZE` observations, the
+        requests are sent simultaneously through the shared session.
+
+        """
+        windows = self._windows(self.start, self.end)
+        data = []
+        # An error raised by a worker cancels the windows not yet started
+        with ThreadPoolExecutor(max_workers=_N_WORKERS) as executor:
+            for res in executor.map(lambda w: self._fetch_records(*w),
+                                    windows):
+                data.extend(res)
+
+        return data
+
+    def _fetch_records(self, start, end):
+        """ Download a window and check the answer of Poloniex. """
+        res = self._fetch_window(start, end)
+        # Poloniex returns a dict when an error occurs
+        if not isinstance(res, list):
+            raise ValueError('Poloniex error on window [{}, {}]: {}'.format(
+                start, end, res.get('error', res)
+            ))
+
+        # Empty windows contain only a placeholder with date 0
+        return [e for e in res if e['date'] != 0]
+
+    def _windows(self, start, end):
+        """ Tile [start, end] into contiguous and non-overlapping windows,
+        bounds are included by Poloniex API. Windows are aligned on a grid
+        of `_WINDOW_SIZE` observations such that they can be cached.
+
+        """
+        step = self._step
+
+        return [(max(t, start), min(t + step - self.span, end))
+                for t in range(start // step * step, end + 1, step)]
+
+    def _fetch_window(self, start, end):
+        # Only complete windows already closed are cached
+        cached = (start % self._step == 0
+                  and end == start + self._step - self.span
+                  and end + self.span <= time.time())
+        cache_file = os.path.join(
+            self._cache_dir,
+            '{}_{}_{}.json'.format(self.pair, self.span, start)
+        )
+        if cached and os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r') as f:
+                    return json.load(f)
+
+            except ValueError:
+                # Corrupted cache file, download again the window
+                pass
+
+        headers = {}
+        last = self._open_window
+        if last is not None and last[:2] == (start, end):
+            headers['If-None-Match'] = last[2]
+
+        param = dict(self._param, start=start, end=end)
+        self._throttle()
+        r = self._session.get(
+            self._url, params=param, headers=headers, timeout=(3.05, 30)
+        )
+        if r.status_code == 304 and 'If-None-Match' in headers:
+
+            return last[3]
+
+        r.raise_for_status()
+        data = r.json()
+
+        # Poloniex returns a dict when an error occurs
+        if cached and isinstance(data, list):
+            self._write_cache(cache_file, data)
+
+        elif (isinstance(data, list) and 'ETag' in r.headers
+              and end + self.span > time.time()):
+            self._open_window = (start, end, r.headers['ETag'], data)
+
+        return data
+
+    def _throttle(self):
+        """ Wait such that requests start at least `_MIN_INTERVAL` seconds
+        apart, whatever the number of workers.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._next_request:
+                time.sleep(self._next_request - now)
+
+            self._next_request = max(now, self._next_request) + _MIN_INTERVAL
+
+    def _write_cache(self, cache_file, data):
+        """ Write atomically `data` into `cache_file`, such that an interrupted
+        download never leaves a truncated cache file.
+
+        """
+        pathlib.Path(self._cache_dir).mkdir(parents=True, exist_ok=True)
+        f = tempfile.NamedTemporaryFile(
+            'w', dir=self._cache_dir, suffix='.tmp', delete=False
+        )
+        try:
+            with f:
+                json.dump(data, f)
+
+            os.replace(f.name, cache_file)
 
-        return json.loads(r.text)
+        except BaseException:
+            os.remove(f.name)
+            raise
 
     def import_data(self, start='last', end='now'):
         """ Download data from Poloniex for specific time interval.
@@ -1,3 +1,4 @@
+import os
 import time
 
 import pandas as pd
@@ -6,10 +7,40 @@ import pytest
 
 from dccd import FromPoloniex as fp
 
+class FakeResponse:
+    def __init__(self, data, status_code=200, headers=None):
+        self.data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self.data
+
+    def raise_for_status(self):
+        pass
+
+class FakeGet:
+    """ Replace `session.get`, record calls and return `response(param)`. """
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def __call__(self, url, params=None, headers=None, timeout=None):
+        self.calls.append({'params': params, 'headers': headers,
+                           'time': time.monotonic()})
+        return self.response(params)
+
+def candles(param):
+    return FakeResponse([{'date': param['start'], 'close': 1.}])
+
 @pytest.fixture
 def init_loader():
     return fp('/home/arthur/Data/Crypto_Currencies/', 'XBT', 86400, 'USD')
 
+@pytest.fixture
+def tmp_loader(tmp_path):
+    return fp(str(tmp_path), 'XBT', 86400, 'USD')
+
 def test_import_data(init_loader):
     start = time.time() // 86400 * 86400 - 86400
     data = init_loader._import_data(start=start)
@@ -23,4 +54,139 @@ def test_import_data(init_loader):
 
 def test_get_data(init_loader):
     init_loader.df = pd.DataFrame()
-    assert isinstance(init_loader.get_data(), pd.DataFrame)
\ No newline at end of file
+    assert isinstance(init_loader.get_data(), pd.DataFrame)
+
+def test_windows(init_loader):
+    span = init_loader.span
+    windows = init_loader._windows(0, 12000 * span)
+    assert windows[0][0] == 0
+    assert windows[-1][1] == 12000 * span
+    for (_, end), (start, _) in zip(windows[:-1], windows[1:]):
+        assert start == end + span
+
+def test_windows_aligned(init_loader):
+    span = init_loader.span
+    windows = init_loader._windows(3 * span, 12000 * span)
+    assert windows[0] == (3 * span, 4999 * span)
+    assert windows[1] == (5000 * span, 9999 * span)
+
+def test_invalid_span():
+    with pytest.raises(ValueError):
+        fp('/home/arthur/Data/Crypto_Currencies/', 'XBT', 3600, 'USD')
+
+@pytest.mark.parametrize('span', [300, 900, 1800, 7200, 14400, 86400])
+def test_valid_span(span):
+    loader = fp('/home/arthur/Data/Crypto_Currencies/', 'XBT', span, 'USD')
+    assert loader.per is not None
+    assert 'None' not in loader.full_path
+
+def test_import_data_huge_error(tmp_loader):
+    tmp_loader._session.get = FakeGet(
+        lambda param: FakeResponse({'error': 'Invalid currency pair.'})
+    )
+    tmp_loader.start, tmp_loader.end = 0, 6000 * tmp_loader.span
+    with pytest.raises(ValueError, match='Invalid currency pair.'):
+        tmp_loader._import_data_huge()
+
+def test_import_data_huge_error_cancel(tmp_loader):
+    def response(param):
+        time.sleep(0.01)
+        return FakeResponse({'error': 'Invalid currency pair.'})
+    get = tmp_loader._session.get = FakeGet(response)
+    tmp_loader.start, tmp_loader.end = 0, 201 * tmp_loader._step
+    with pytest.raises(ValueError):
+        tmp_loader._import_data_huge()
+    # Windows not yet started are cancelled
+    assert len(get.calls) < 20
+
+def test_import_data_huge_throttle(tmp_loader):
+    get = tmp_loader._session.get = FakeGet(candles)
+    tmp_loader.start, tmp_loader.end = 0, 8 * tmp_loader._step - 1
+    tmp_loader._import_data_huge()
+    times = sorted(call['time'] for call in get.calls)
+    assert len(times) == 8
+    for t0, t1 in zip(times[:-1], times[1:]):
+        assert t1 - t0 >= 0.24
+
+def test_import_data_huge_empty_window(tmp_loader):
+    def response(param):
+        if param['start'] == 0:
+            return FakeResponse([{'date': 0, 'close': 0}])
+        return candles(param)
+    tmp_loader._session.get = FakeGet(response)
+    tmp_loader.start, tmp_loader.end = 0, 6000 * tmp_loader.span
+    data = tmp_loader._import_data_huge()
+    assert data == [{'date': 5000 * tmp_loader.span, 'close': 1.}]
+
+def test_cache(tmp_loader):
+    span, step = tmp_loader.span, tmp_loader._step
+    get = tmp_loader._session.get = FakeGet(candles)
+    cache_file = os.path.join(
+        tmp_loader.path, 'Poloniex', '.cache', 'USDT_BTC_86400_0.json'
+    )
+    # Closed aligned window is downloaded once then read from disk
+    data = tmp_loader._fetch_window(0, step - span)
+    assert os.path.exists(cache_file)
+    assert tmp_loader._fetch_window(0, step - span) == data
+    assert len(get.calls) == 1
+    # Corrupted cache file is downloaded again
+    with open(cache_file, 'w') as f:
+        f.write('[{"date"')
+    assert tmp_loader._fetch_window(0, step - span) == data
+    assert len(get.calls) == 2
+    # Partial and open windows always call the session
+    now = int(time.time()) // step * step
+    for start, end in [(span, step - span), (now, now + step - span)]:
+        tmp_loader._fetch_window(start, end)
+        tmp_loader._fetch_window(start, end)
+    assert len(get.calls) == 6
+    # Errors are never cached
+    tmp_loader._session.get = FakeGet(
+        lambda param: FakeResponse({'error': 'Invalid currency pair.'})
+    )
+    tmp_loader._fetch_window(step, 2 * step - span)
+    cache_dir = os.path.dirname(cache_file)
+    assert os.listdir(cache_dir) == ['USDT_BTC_86400_0.json']
+
+@pytest.mark.parametrize('form', ['parquet', 'feather'])
+def test_save_columnar(tmp_loader, form):
+    pytest.importorskip('pyarrow')
+    span = tmp_loader.span
+    tmp_loader.start = 1560000000 // span * span
+    tmp_loader.end = tmp_loader.start + 3 * span
+    data = [{'date': tmp_loader.start + i * span, 'close': float(i)}
+            for i in range(4)]
+    tmp_loader._sort_data(data).save(form=form)
+    assert tmp_loader._get_last_date() == tmp_loader.end
+
+def test_open_window_etag(tmp_loader):
+    span, step = tmp_loader.span, tmp_loader._step
+    start = int(time.time()) // step * step
+    end = int(time.time()) // span * span
+
+    def response(param):
+        if get.calls[-1]['headers'].get('If-None-Match') == '"v1"':
+            return FakeResponse(None, status_code=304)
+        return FakeResponse([{'date': end, 'close': 1.}],
+                            headers={'ETag': '"v1"'})
+
+    get = tmp_loader._session.get = FakeGet(response)
+    data = tmp_loader._fetch_window(start, end)
+    assert get.calls[0]['headers'] == {}
+    # Same open window is revalidated, 304 returns the stored records
+    assert tmp_loader._fetch_window(start, end) == data
+    assert get.calls[1]['headers'] == {'If-None-Match': '"v1"'}
+    # Other windows are not conditional
+    tmp_loader._fetch_window(span, step - span)
+    assert get.calls[2]['headers'] == {}
+
+def test_unconditional_not_modified(tmp_loader):
+    span, step = tmp_loader.span, tmp_loader._step
+    stored = [{'date': step, 'close': 1.}]
+    tmp_loader._session.get = FakeGet(
+        lambda param: FakeResponse(None, status_code=304)
+    )
+    # 304 without stored window or for another window is not a cache hit
+    assert tmp_loader._fetch_window(span, step - span) is None
+    tmp_loader._open_window = (step, step + span, '"v1"', stored)
+    assert tmp_loader._fetch_window(span, step - span) is None
\ No newline at end of file
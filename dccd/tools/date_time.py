@@ -106,12 +106,16 @@ def str_to_span(string):
         return 604800
     elif string.lower() in ['daily', 'day', '24h', '1d', 'd']:
         return 86400
+    elif string.lower() in ['four-hourly', 'four-hour', '4h']:
+        return 14400
     elif string.lower() in ['bi-hourly', 'bi-hour', '2h']:
         return 7200
     elif string.lower() in ['hourly', 'hour', '1h', '60min', 'h']:
         return 3600
     elif string.lower() in ['half-hourly', 'half-hour', '30min']:
         return 1800
+    elif string.lower() in ['quarter-hourly', 'quarter-hour', '15min']:
+        return 900
     elif string.lower() in ['5-minute', 'five-minute', '5 minute',
                             'five minute', '5min']:
         return 300
@@ -145,12 +149,16 @@ def span_to_str(span):
         return 'Minutely'
     elif span == 300:
         return 'Five_Minutely'
+    elif span == 900:
+        return 'Quarter_Hourly'
     elif span == 1800:
         return 'Half_Hourly'
     elif span == 3600:
         return 'Hourly'
     elif span == 7200:
         return 'Bi_Hourly'
+    elif span == 14400:
+        return 'Four_Hourly'
     elif span == 86400:
         return 'Daily'
     elif span == 604800:
@@ -72,6 +72,7 @@ setup(
         'numpy>=1.14.1',
         'pandas>=0.22.0',
         'requests>=2.18.4',
+        'urllib3>=1.21.1',
         'xlrd>=1.1.0',
         'xlsxwriter>=1.0.2',
         'websockets>=7.0.0',